@@ -7,16 +7,36 @@ Demonstrates two optimization regimes for minimizing variational free energy:
 2. Sensitivity Annealing - adaptive gain control reduction
 """
 
-import random
+from __future__ import annotations
+
+import argparse
 import math
-import tkinter as tk
-from typing import List, Tuple, Dict, Any
+import numpy as np
+from typing import List, Optional, Tuple, Dict, Any
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    import tkinter as tk
+except ImportError:  # tkinter is only needed for the GUI, not --headless
+    tk = None
+else:
+    # Module-level bindings of the Tk constants used when packing widgets
+    _BOTH, _X, _RIDGE = tk.BOTH, tk.X, tk.RIDGE
 
 # ========== Configuration ==========
 STEPS: int = 100
 LEARNING_RATE: float = 0.08
 TRUE_MEAN: float = 2.0
 TRUE_STD: float = 1.0
+MODEL_STD: float = 1.0  # fixed σ of both learned models
 SAMPLE_SIZE: int = 80
 
 # Display settings
@@ -24,17 +44,28 @@ WINDOW_WIDTH: int = 850
 WINDOW_HEIGHT: int = 700
 PLOT_HEIGHT: int = 160
 UPDATE_DELAY: int = 50  # milliseconds between steps
+REDRAW_INTERVAL: int = 50  # milliseconds between plot redraws
+FULL_REDRAW_INTERVAL: int = 10  # steps between full line re-projections
+FORCED_REDRAW_STEPS: int = 10  # max steps a converged plot may go undrawn
 
 # ========== Math Utilities ==========
-def mean(values: List[float]) -> float:
-    """Calculate arithmetic mean of a list of values."""
-    return sum(values) / len(values) if values else 0.0
-
-def variance(values: List[float], mean_val: float) -> float:
-    """Calculate sample variance given values and their mean."""
-    if len(values) < 2:
-        return 1.0
-    return sum((x - mean_val) ** 2 for x in values) / (len(values) - 1)
+def mean_var(samples: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mean and unbiased variance along the last axis in a single pass.
+    
+    Uses the running sums Σx and Σx² rather than a second pass over the
+    deviations from the mean.
+    
+    Args:
+        samples: Array of samples, one sample set per row
+    
+    Returns:
+        Tuple of (means, variances) with the last axis reduced
+    """
+    n: int = samples.shape[-1]
+    s: np.ndarray = samples.sum(axis=-1)
+    s2: np.ndarray = np.einsum("...i,...i->...", samples, samples)
+    return s / n, (s2 - s * s / n) / (n - 1)
 
 def kl_divergence(m1: float, s1: float, m2: float, s2: float) -> float:
     """
@@ -51,27 +82,94 @@ def kl_divergence(m1: float, s1: float, m2: float, s2: float) -> float:
     """
     if s1 <= 0 or s2 <= 0:
         return 0.0
-    return math.log(s2/s1) + (s1*s1 + (m1-m2)**2)/(2*s2*s2) - 0.5
+    # log1p keeps log(s2/s1) accurate when the deviations are close
+    return math.log1p((s2-s1)/s1) + (s1*s1 + (m1-m2)**2)/(2*s2*s2) - 0.5
+
+@njit(cache=True, fastmath=True)
+def _step_kernel(
+    theta_p: float,
+    theta_a: float,
+    alpha: float,
+    sample_mean: float,
+    sample_var: float,
+    sample_size: int,
+    true_mean: float,
+    true_std: float,
+    kl_offset: float,
+    lr: float
+) -> Tuple[float, float, float, float, float, float]:
+    """
+    Compiled numeric core of a single dual-path simulation step.
+    
+    Returns:
+        Tuple of (theta_p, theta_a, kl_p, kl_a, loss_p, loss_a)
+    """
+    # Regime 1: direct gradient descent; Regime 2: gain-modulated descent
+    theta_p -= lr * (theta_p - sample_mean)
+    theta_a -= lr * alpha * (theta_a - sample_mean)
+    
+    # With both σ fixed, kl_divergence is a constant offset (its value at
+    # equal means) plus (m1-m2)²/(2σ²); only the means vary per step
+    inv_two_var = 0.5 / (true_std * true_std)
+    kl_p = kl_offset + (theta_p - true_mean) ** 2 * inv_two_var
+    kl_a = kl_offset + (theta_a - true_mean) ** 2 * inv_two_var
+    
+    # MSE of a constant prediction: E[(X-θ)²] = Var(X) + (E[X]-θ)²,
+    # with the unbiased sample variance rescaled to the 1/n form
+    pop_var = sample_var * (sample_size - 1) / sample_size
+    loss_p = pop_var + (sample_mean - theta_p) ** 2
+    loss_a = pop_var + (sample_mean - theta_a) ** 2
+    
+    return theta_p, theta_a, kl_p, kl_a, loss_p, loss_a
+
+# σ-only part of KL(N(θ, MODEL_STD²) || N(TRUE_MEAN, TRUE_STD²))
+_KL_OFFSET: float = kl_divergence(0.0, MODEL_STD, 0.0, TRUE_STD)
+
+# Trigger compilation once at import so the first animation frame is smooth
+_step_kernel(0.0, 0.0, 0.0, 0.0, 1.0, SAMPLE_SIZE, 0.0, 1.0, 0.0, 0.0)
 
 # ========== Simulation State ==========
 class SimulationState:
     """Manages the dual-path optimization simulation state and updates."""
     
-    def __init__(self) -> None:
-        """Initialize simulation with both optimization paths at origin."""
+    def __init__(self, steps: int = STEPS) -> None:
+        """
+        Initialize simulation with both optimization paths at origin.
+        
+        Args:
+            steps: Number of steps to pre-draw samples and history for
+        """
         # Model parameters
         self.theta_purify: float = 0.0
         self.theta_anneal: float = 0.0
-        self.sigma_purify: float = 1.0
-        self.sigma_anneal: float = 1.0
         self.alpha: float = 1.0
         
-        # History tracking
-        self.kl_purify: List[float] = []
-        self.kl_anneal: List[float] = []
-        self.loss_purify: List[float] = []
-        self.loss_anneal: List[float] = []
-        self.alpha_history: List[float] = []
+        # Pre-draw all data samples and their per-step statistics
+        self.rng: np.random.Generator = np.random.default_rng()
+        self._data: np.ndarray = self.rng.normal(
+            TRUE_MEAN, TRUE_STD, (steps, SAMPLE_SIZE)
+        )
+        self._means: np.ndarray
+        self._vars: np.ndarray
+        self._means, self._vars = mean_var(self._data)
+        
+        # Exponential gain decay schedule, indexed by step number
+        self._alphas: np.ndarray = np.maximum(
+            0.001, np.power(0.985, np.arange(steps + 1))
+        )
+        
+        # History tracking (preallocated, filled in by step number)
+        self.kl_purify: np.ndarray = np.empty(steps)
+        self.kl_anneal: np.ndarray = np.empty(steps)
+        self.loss_purify: np.ndarray = np.empty(steps)
+        self.loss_anneal: np.ndarray = np.empty(steps)
+        self.alpha_history: np.ndarray = self._alphas[1:]
+        
+        # Running value bounds of the KL and loss histories
+        self.kl_min: float = math.inf
+        self.kl_max: float = -math.inf
+        self.loss_min: float = math.inf
+        self.loss_max: float = -math.inf
         
     def step(self, step_num: int) -> None:
         """
@@ -80,49 +178,32 @@ class SimulationState:
         Args:
             step_num: Current step number (1-indexed)
         """
-        # Generate data samples from true distribution
-        data: List[float] = [
-            random.gauss(TRUE_MEAN, TRUE_STD) 
-            for _ in range(SAMPLE_SIZE)
-        ]
-        sample_mean: float = mean(data)
-        sample_var: float = variance(data, sample_mean)
-        sample_std: float = math.sqrt(sample_var)
-        
-        # Compute variational free-energy gradients
-        # F = E_q[log q - log p] where q is our model, p is true distribution
-        grad_purify_mean: float = self.theta_purify - sample_mean
-        grad_anneal_mean: float = self.theta_anneal - sample_mean
-        
-        # Regime 1: Representation purification (geometric correction)
-        # Direct gradient descent on KL divergence
-        self.theta_purify -= LEARNING_RATE * grad_purify_mean
-        
-        # Regime 2: Sensitivity annealing (gain control)
-        # Modulated gradient descent with exponentially decaying gain
-        self.theta_anneal -= LEARNING_RATE * self.alpha * grad_anneal_mean
-        self.alpha = max(0.001, self.alpha * 0.985)  # Exponential decay
-        
-        # Track information-theoretic metrics (no arbitrary clipping)
-        kl_p: float = kl_divergence(
-            self.theta_purify, self.sigma_purify, 
-            TRUE_MEAN, TRUE_STD
+        # Look up pre-drawn samples from true distribution
+        k: int = step_num - 1
+        sample_mean: float = float(self._means[k])
+        sample_var: float = float(self._vars[k])
+        
+        # Gradient updates, KL and MSE in one compiled kernel; the gain
+        # follows the precomputed decay schedule
+        (
+            self.theta_purify, self.theta_anneal,
+            kl_p, kl_a, loss_p, loss_a
+        ) = _step_kernel(
+            self.theta_purify, self.theta_anneal, float(self._alphas[k]),
+            sample_mean, sample_var, SAMPLE_SIZE,
+            TRUE_MEAN, TRUE_STD, _KL_OFFSET, LEARNING_RATE
         )
-        kl_a: float = kl_divergence(
-            self.theta_anneal, self.sigma_anneal,
-            TRUE_MEAN, TRUE_STD
-        )
-        
-        # Track prediction loss (mean squared error)
-        loss_p: float = mean([(x - self.theta_purify)**2 for x in data])
-        loss_a: float = mean([(x - self.theta_anneal)**2 for x in data])
         
         # Update histories
-        self.kl_purify.append(kl_p)
-        self.kl_anneal.append(kl_a)
-        self.loss_purify.append(loss_p)
-        self.loss_anneal.append(loss_a)
-        self.alpha_history.append(self.alpha)
+        self.kl_purify[k] = kl_p
+        self.kl_anneal[k] = kl_a
+        self.loss_purify[k] = loss_p
+        self.loss_anneal[k] = loss_a
+        self.kl_min = min(self.kl_min, kl_p, kl_a)
+        self.kl_max = max(self.kl_max, kl_p, kl_a)
+        self.loss_min = min(self.loss_min, loss_p, loss_a)
+        self.loss_max = max(self.loss_max, loss_p, loss_a)
+        self.alpha = float(self._alphas[step_num])
 
 # ========== Visualization Components ==========
 class PlotCanvas:
@@ -133,7 +214,8 @@ class PlotCanvas:
         parent: tk.Frame, 
         title: str, 
         labels: List[str], 
-        colors: List[str]
+        colors: List[str],
+        points: Optional[np.ndarray] = None
     ) -> None:
         """
         Create a plot canvas.
@@ -143,14 +225,50 @@ class PlotCanvas:
             title: Plot title
             labels: Series labels for legend
             colors: Hex color codes for each series
+            points: Optional coordinate buffer of another canvas of the
+                same size to share instead of allocating a new one
         """
         self.title: str = title
         self.labels: List[str] = labels
         self.colors: List[str] = colors
         
+        # Canvas geometry (fixed for the lifetime of the plot)
+        self.width: int = WINDOW_WIDTH - 40
+        self.height: int = PLOT_HEIGHT
+        self.padding: int = 30
+        self.plot_width: int = self.width - 2 * self.padding
+        self.plot_height: int = self.height - 2 * self.padding
+        self.bottom: int = self.height - self.padding
+        self.legend_x: int = self.width - self.padding - 120
+        self.legend_y: int = self.padding + 10
+        
+        # Interleaved x0, y0, x1, y1, ... scratch buffer; the x slots hold
+        # the fixed pixel position of every step
+        if points is None:
+            points = np.empty(2 * STEPS)
+            points[0::2] = (
+                self.padding + self.plot_width * np.arange(STEPS) / (STEPS - 1)
+            )
+        self.points: np.ndarray = points
+        
+        # Canvas item IDs for elements updated on every draw
+        self._series_ids: List[int] = []
+        self._series_visible: bool = False
+        self._segment_ids: List[int] = []
+        self._step_label_id: int = 0
+        self._max_label_id: int = 0
+        self._min_label_id: int = 0
+        
+        # Projection used for the last full redraw, and the pixel row of
+        # each series' last drawn point
+        self._drawn_steps: int = 0
+        self._drawn_ys: List[float] = [0.0] * len(colors)
+        self._drawn_min: float = 0.0
+        self._drawn_range: float = 0.0
+        
         # Create frame
         self.frame: tk.Frame = tk.Frame(parent, bg="#ffffff")
-        self.frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        self.frame.pack(fill=_BOTH, expand=True, pady=(0, 10))
         
         # Title
         title_label: tk.Label = tk.Label(
@@ -165,170 +283,250 @@ class PlotCanvas:
         # Canvas
         self.canvas: tk.Canvas = tk.Canvas(
             self.frame,
-            width=WINDOW_WIDTH-40,
-            height=PLOT_HEIGHT,
+            width=self.width,
+            height=self.height,
             bg="#f8fafc",
             highlightthickness=1,
             highlightbackground="#cbd5e1"
         )
         self.canvas.pack(pady=(5, 0))
     
-    def draw(self, data_series: List[List[float]]) -> None:
+    def draw(
+        self,
+        data_series: List[np.ndarray],
+        step_num: int,
+        value_bounds: Optional[Tuple[float, float]] = None
+    ) -> None:
         """
         Render multiple data series on the canvas.
         
+        Static elements are created on the first call; later calls only
+        move the series lines and rewrite the label text in place.
+        
         Args:
-            data_series: List of data series to plot (same length)
+            data_series: List of history buffers to plot (same length)
+            step_num: Number of filled entries at the start of each buffer
+            value_bounds: Optional (min, max) over the filled entries;
+                computed from the buffers when omitted
         """
-        self.canvas.delete("all")
-        
-        if not data_series or not data_series[0]:
-            return
-        
-        # Canvas dimensions
-        width: int = WINDOW_WIDTH - 40
-        height: int = PLOT_HEIGHT
-        padding: int = 30
-        plot_width: int = width - 2 * padding
-        plot_height: int = height - 2 * padding
-        
-        # Compute value range across all series
-        all_values: List[float] = [v for series in data_series for v in series]
-        if not all_values:
+        if not data_series or step_num <= 0:
             return
-        
-        max_val: float = max(all_values)
-        min_val: float = min(all_values)
+        data_series = [series[:step_num] for series in data_series]
+        
+        # Value range across all series
+        min_val: float
+        max_val: float
+        if value_bounds is None:
+            min_val = float(min(series.min() for series in data_series))
+            max_val = float(max(series.max() for series in data_series))
+        else:
+            min_val, max_val = value_bounds
         value_range: float = max_val - min_val
         
         # Prevent division by zero
         if value_range < 1e-9:
             value_range = 1.0
         
+        if not self._series_ids:
+            self._create_items()
+        
+        # Extend the lines with the new steps while the y-range holds;
+        # otherwise re-project the full history
+        tolerance: float = 1e-3 * value_range
+        if (
+            self._drawn_steps >= 2
+            and step_num % FULL_REDRAW_INTERVAL != 0
+            and abs(min_val - self._drawn_min) <= tolerance
+            and abs(value_range - self._drawn_range) <= tolerance
+        ):
+            # A plot whose new points all land on the pixel rows it already
+            # shows is left untouched, up to FORCED_REDRAW_STEPS steps
+            force: bool = (
+                step_num - self._drawn_steps >= FORCED_REDRAW_STEPS
+                or step_num >= STEPS
+            )
+            if not self._extend_series(data_series, force):
+                return
+        else:
+            self._draw_series(data_series, min_val, value_range)
+        
+        # Update annotations
+        self._draw_labels(max_val, min_val, len(data_series[0]))
+    
+    def _create_items(self) -> None:
+        """Create the static plot elements and the updatable items."""
         # Draw coordinate system
-        self._draw_axes(width, height, padding)
-        self._draw_grid(width, height, padding, plot_height)
+        self._draw_axes()
+        self._draw_grid()
         
-        # Draw data series
-        self._draw_series(
-            data_series, width, height, padding, 
-            plot_width, plot_height, min_val, value_range
+        # Series lines stay hidden until they have two points
+        self._series_ids = [
+            self.canvas.create_line(
+                0, 0, 0, 0,
+                fill=color,
+                width=2,
+                state="hidden"
+            )
+            for color in self.colors
+        ]
+        
+        # X-axis label (step counter)
+        self._step_label_id = self.canvas.create_text(
+            self.width - self.padding - 5, self.bottom + 15,
+            font=("Arial", 8),
+            fill="#64748b"
         )
         
-        # Draw annotations
-        self._draw_labels(
-            width, height, padding, 
-            max_val, min_val, len(data_series[0])
+        # Y-axis max
+        self._max_label_id = self.canvas.create_text(
+            self.padding - 5, self.padding,
+            font=("Arial", 8),
+            anchor="e",
+            fill="#64748b"
+        )
+        
+        # Y-axis min
+        self._min_label_id = self.canvas.create_text(
+            self.padding - 5, self.bottom,
+            font=("Arial", 8),
+            anchor="e",
+            fill="#64748b"
         )
         
         # Draw legend
         if len(self.labels) > 1:
-            self._draw_legend(width, padding)
+            self._draw_legend()
     
-    def _draw_axes(self, width: int, height: int, padding: int) -> None:
+    def _draw_axes(self) -> None:
         """Draw x and y axes."""
         # X-axis
         self.canvas.create_line(
-            padding, height - padding,
-            width - padding, height - padding,
+            self.padding, self.bottom,
+            self.width - self.padding, self.bottom,
             fill="#94a3b8", width=1
         )
         # Y-axis
         self.canvas.create_line(
-            padding, padding,
-            padding, height - padding,
+            self.padding, self.padding,
+            self.padding, self.bottom,
             fill="#94a3b8", width=1
         )
     
-    def _draw_grid(
-        self, 
-        width: int, 
-        height: int, 
-        padding: int, 
-        plot_height: int
-    ) -> None:
+    def _draw_grid(self) -> None:
         """Draw horizontal grid lines."""
         for i in range(5):
-            y: float = padding + (plot_height * i / 4)
+            y: float = self.padding + (self.plot_height * i / 4)
             self.canvas.create_line(
-                padding, y,
-                width - padding, y,
+                self.padding, y,
+                self.width - self.padding, y,
                 fill="#e2e8f0", width=1, dash=(2, 2)
             )
     
     def _draw_series(
         self,
-        data_series: List[List[float]],
-        width: int,
-        height: int,
-        padding: int,
-        plot_width: int,
-        plot_height: int,
+        data_series: List[np.ndarray],
         min_val: float,
         value_range: float
     ) -> None:
-        """Draw smooth line plots for each data series."""
-        for series, color in zip(data_series, self.colors):
-            if len(series) < 2:
+        """Move each series line to its current points."""
+        if self._segment_ids:
+            self.canvas.delete(*self._segment_ids)
+            self._segment_ids = []
+        
+        for i, (series, line_id) in enumerate(
+            zip(data_series, self._series_ids)
+        ):
+            n: int = len(series)
+            if n < 2:
                 continue
             
-            points: List[float] = []
-            for i, value in enumerate(series):
-                x: float = padding + (plot_width * i / (STEPS - 1))
-                y: float = height - padding - (
-                    (value - min_val) / value_range * plot_height
-                )
-                y = max(padding, min(height - padding, y))
-                points.extend([x, y])
+            # Map values to pixels in the y slots of the shared buffer
+            self.points[1:2 * n:2] = np.clip(
+                self.bottom - (series - min_val) / value_range * self.plot_height,
+                self.padding, self.bottom
+            )
+            
+            self.canvas.coords(line_id, self.points[:2 * n].tolist())
+            self._drawn_ys[i] = float(self.points[2 * n - 1])
+            if not self._series_visible:
+                self.canvas.itemconfigure(line_id, state="normal")
+        
+        if len(data_series[0]) >= 2:
+            self._series_visible = True
+        
+        self._drawn_steps = len(data_series[0])
+        self._drawn_min = min_val
+        self._drawn_range = value_range
+    
+    def _extend_series(
+        self,
+        data_series: List[np.ndarray],
+        force: bool = False
+    ) -> bool:
+        """
+        Append the steps drawn since the last frame as short segments.
+        
+        Args:
+            data_series: Filled slices of the history buffers
+            force: Draw even if the new points would not change any pixel row
+        
+        Returns:
+            False if the frame was skipped because every new point rounds
+            to the pixel row of its series' last drawn point
+        """
+        start: int = self._drawn_steps - 1
+        n: int = len(data_series[0])
+        if n <= self._drawn_steps:
+            return True
+        
+        ys: List[np.ndarray] = [
+            np.clip(
+                self.bottom
+                - (series[start:n] - self._drawn_min)
+                / self._drawn_range * self.plot_height,
+                self.padding, self.bottom
+            )
+            for series in data_series
+        ]
+        if not force and all(
+            np.all(np.rint(series_ys) == round(last_y))
+            for series_ys, last_y in zip(ys, self._drawn_ys)
+        ):
+            return False
+        
+        for i, (series_ys, color) in enumerate(zip(ys, self.colors)):
+            self.points[2 * start + 1:2 * n:2] = series_ys
+            self._drawn_ys[i] = float(series_ys[-1])
             
-            if len(points) >= 4:
-                self.canvas.create_line(
-                    points,
-                    fill=color,
-                    width=2,
-                    smooth=True
-                )
+            segment_id: int = self.canvas.create_line(
+                self.points[2 * start:2 * n].tolist(),
+                fill=color,
+                width=2
+            )
+            # Keep segments beneath the labels and legend
+            self.canvas.tag_lower(segment_id, self._step_label_id)
+            self._segment_ids.append(segment_id)
+        
+        self._drawn_steps = n
+        return True
     
     def _draw_labels(
         self,
-        width: int,
-        height: int,
-        padding: int,
         max_val: float,
         min_val: float,
         step_count: int
     ) -> None:
-        """Draw axis labels and current values."""
-        # X-axis label (step counter)
-        self.canvas.create_text(
-            width - padding - 5, height - padding + 15,
-            text=f"{step_count}/{STEPS}",
-            font=("Arial", 8),
-            fill="#64748b"
-        )
-        
-        # Y-axis max
-        self.canvas.create_text(
-            padding - 5, padding,
-            text=f"{max_val:.2f}",
-            font=("Arial", 8),
-            anchor="e",
-            fill="#64748b"
-        )
-        
-        # Y-axis min
-        self.canvas.create_text(
-            padding - 5, height - padding,
-            text=f"{min_val:.2f}",
-            font=("Arial", 8),
-            anchor="e",
-            fill="#64748b"
+        """Update axis labels and current values."""
+        self.canvas.itemconfigure(
+            self._step_label_id, text=f"{step_count}/{STEPS}"
         )
+        self.canvas.itemconfigure(self._max_label_id, text=f"{max_val:.2f}")
+        self.canvas.itemconfigure(self._min_label_id, text=f"{min_val:.2f}")
     
-    def _draw_legend(self, width: int, padding: int) -> None:
+    def _draw_legend(self) -> None:
         """Draw legend for multiple series."""
-        legend_x: int = width - padding - 120
-        legend_y: int = padding + 10
+        legend_x: int = self.legend_x
+        legend_y: int = self.legend_y
         
         for label, color in zip(self.labels, self.colors):
             self.canvas.create_line(
@@ -345,6 +543,64 @@ class PlotCanvas:
             )
             legend_y += 18
 
+class MultiPlot:
+    """Owns the KL, loss and gain panels and renders them together."""
+    
+    def __init__(self, parent: tk.Frame) -> None:
+        """
+        Create the three plot panels.
+        
+        Args:
+            parent: Parent Tkinter frame
+        """
+        self.kl_plot: PlotCanvas = PlotCanvas(
+            parent,
+            "Information Drift (KL Divergence)",
+            ["Purification", "Annealing"],
+            ["#dc2626", "#2563eb"]
+        )
+        
+        # All panels share one geometry, so they share one coordinate buffer
+        self.points: np.ndarray = self.kl_plot.points
+        
+        self.loss_plot: PlotCanvas = PlotCanvas(
+            parent,
+            "Prediction Loss (MSE)",
+            ["Purification", "Annealing"],
+            ["#dc2626", "#2563eb"],
+            self.points
+        )
+        
+        self.alpha_plot: PlotCanvas = PlotCanvas(
+            parent,
+            "Sensitivity Parameter α (Gain Control)",
+            ["Alpha"],
+            ["#16a34a"],
+            self.points
+        )
+    
+    def render_all(self, state: SimulationState, step_num: int) -> None:
+        """
+        Draw every panel from the current simulation state.
+        
+        Args:
+            state: Simulation state holding the history buffers
+            step_num: Number of completed steps
+        """
+        self.kl_plot.draw(
+            [state.kl_purify, state.kl_anneal], step_num,
+            (state.kl_min, state.kl_max)
+        )
+        self.loss_plot.draw(
+            [state.loss_purify, state.loss_anneal], step_num,
+            (state.loss_min, state.loss_max)
+        )
+        # The gain schedule is non-increasing, so its bounds are its ends
+        self.alpha_plot.draw(
+            [state.alpha_history], step_num,
+            (state.alpha, float(state.alpha_history[0]))
+        )
+
 # ========== Main Application Window ==========
 class SimulationWindow:
     """Main application window managing simulation and visualization."""
@@ -368,16 +624,18 @@ class SimulationWindow:
         # Initialize simulation
         self.state: SimulationState = SimulationState()
         self.current_step: int = 0
+        self.drawn_step: int = 0
         self.running: bool = True
         
-        # Start simulation
+        # Start simulation and, independently, the redraw loop
         self.root.after(100, self.run_step)
+        self.root.after(100, self.redraw)
     
     def _create_layout(self) -> None:
         """Create the main UI layout with header, status panel, and plots."""
         # Main container
         main_frame: tk.Frame = tk.Frame(self.root, bg="#ffffff")
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
+        main_frame.pack(fill=_BOTH, expand=True, padx=20, pady=15)
         
         # Header
         header: tk.Label = tk.Label(
@@ -393,33 +651,14 @@ class SimulationWindow:
         self._create_status_panel(main_frame)
         
         # Create plots
-        self.kl_plot: PlotCanvas = PlotCanvas(
-            main_frame,
-            "Information Drift (KL Divergence)",
-            ["Purification", "Annealing"],
-            ["#dc2626", "#2563eb"]
-        )
-        
-        self.loss_plot: PlotCanvas = PlotCanvas(
-            main_frame,
-            "Prediction Loss (MSE)",
-            ["Purification", "Annealing"],
-            ["#dc2626", "#2563eb"]
-        )
-        
-        self.alpha_plot: PlotCanvas = PlotCanvas(
-            main_frame,
-            "Sensitivity Parameter α (Gain Control)",
-            ["Alpha"],
-            ["#16a34a"]
-        )
+        self.plots: MultiPlot = MultiPlot(main_frame)
     
     def _create_status_panel(self, parent: tk.Frame) -> None:
         """Create the status panel with real-time metrics."""
         status_frame: tk.Frame = tk.Frame(
-            parent, bg="#f8fafc", relief=tk.RIDGE, bd=1
+            parent, bg="#f8fafc", relief=_RIDGE, bd=1
         )
-        status_frame.pack(fill=tk.X, pady=(0, 15))
+        status_frame.pack(fill=_X, pady=(0, 15))
         
         status_inner: tk.Frame = tk.Frame(status_frame, bg="#f8fafc")
         status_inner.pack(padx=15, pady=10)
@@ -475,48 +714,109 @@ class SimulationWindow:
         self.alpha_label.config(text=f"α: {self.state.alpha:.3f}")
         
         # Update plots
-        self.kl_plot.draw([self.state.kl_purify, self.state.kl_anneal])
-        self.loss_plot.draw([self.state.loss_purify, self.state.loss_anneal])
-        self.alpha_plot.draw([self.state.alpha_history])
+        self.plots.render_all(self.state, self.current_step)
     
     def run_step(self) -> None:
-        """Execute one simulation step and schedule the next."""
+        """Advance the simulation one step and schedule the next."""
         if not self.running or self.current_step >= STEPS:
             if self.current_step >= STEPS:
-                self.print_summary()
+                print_summary(self.state, self.current_step)
             return
         
         self.current_step += 1
         self.state.step(self.current_step)
-        self.update_display()
         
         # Schedule next step
         self.root.after(UPDATE_DELAY, self.run_step)
     
-    def print_summary(self) -> None:
-        """Print final summary statistics to console."""
-        print(f"\n{'='*60}")
-        print("SIMULATION COMPLETE")
-        print(f"{'='*60}")
-        print("\nTwo optimization regimes for variational free energy:")
-        print("  1) Purification: Geometric KL drift correction")
-        print("  2) Annealing: Adaptive gain control reduction")
-        print(f"\nFinal Results (Target: μ={TRUE_MEAN:.4f}, σ={TRUE_STD:.4f}):")
-        print(f"  Purification θ: {self.state.theta_purify:.4f}")
-        print(f"  Annealing θ:    {self.state.theta_anneal:.4f}")
-        print(f"  Final KL (Purify): {self.state.kl_purify[-1]:.6f}")
-        print(f"  Final KL (Anneal): {self.state.kl_anneal[-1]:.6f}")
-        print(f"  Final α: {self.state.alpha_history[-1]:.6f}")
-        print(f"{'='*60}\n")
+    def redraw(self) -> None:
+        """Draw the latest simulation state and schedule the next frame."""
+        if not self.running:
+            return
+        
+        if self.drawn_step != self.current_step:
+            self.drawn_step = self.current_step
+            self.update_display()
+        
+        if self.drawn_step < STEPS:
+            self.root.after(REDRAW_INTERVAL, self.redraw)
     
     def on_closing(self) -> None:
         """Handle window close event."""
         self.running = False
         self.root.destroy()
 
+# ========== Reporting ==========
+def print_summary(state: SimulationState, step_count: int) -> None:
+    """
+    Print final summary statistics to console.
+    
+    Args:
+        state: Simulation state after the final step
+        step_count: Number of completed steps
+    """
+    print(f"\n{'='*60}")
+    print("SIMULATION COMPLETE")
+    print(f"{'='*60}")
+    print("\nTwo optimization regimes for variational free energy:")
+    print("  1) Purification: Geometric KL drift correction")
+    print("  2) Annealing: Adaptive gain control reduction")
+    print(f"\nFinal Results (Target: μ={TRUE_MEAN:.4f}, σ={TRUE_STD:.4f}):")
+    print(f"  Purification θ: {state.theta_purify:.4f}")
+    print(f"  Annealing θ:    {state.theta_anneal:.4f}")
+    last: int = step_count - 1
+    print(f"  Final KL (Purify): {state.kl_purify[last]:.6f}")
+    print(f"  Final KL (Anneal): {state.kl_anneal[last]:.6f}")
+    print(f"  Final α: {state.alpha_history[last]:.6f}")
+    print(f"{'='*60}\n")
+
+def run_headless(steps: int) -> SimulationState:
+    """
+    Run the simulation to completion without a GUI and print the summary.
+    
+    Args:
+        steps: Number of simulation steps
+    
+    Returns:
+        Final simulation state
+    """
+    state: SimulationState = SimulationState(steps)
+    for step_num in range(1, steps + 1):
+        state.step(step_num)
+    print_summary(state, steps)
+    return state
+
 # ========== Application Entry Point ==========
 def main() -> None:
-    """Initialize and run the simulation application."""
+    """Parse command-line options and run the simulation application."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Dual-Path Convergence: KL Drift vs Gain Control"
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="run without the Tk GUI and only print the summary"
+    )
+    parser.add_argument(
+        "--steps",
+        type=int,
+        default=None,
+        help=f"number of simulation steps in headless mode (default: {STEPS})"
+    )
+    args: argparse.Namespace = parser.parse_args()
+    
+    if args.steps is not None:
+        if not args.headless:
+            parser.error("--steps requires --headless")
+        if args.steps < 1:
+            parser.error("--steps must be at least 1")
+    
+    if args.headless:
+        run_headless(args.steps if args.steps is not None else STEPS)
+        return
+    if tk is None:
+        parser.error("tkinter is not available; use --headless")
+    
     root: tk.Tk = tk.Tk()
     app: SimulationWindow = SimulationWindow(root)
     root.mainloop()